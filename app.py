@@ -1,10 +1,44 @@
 from flask import Flask, render_template, request, jsonify
-import base64
-import json
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 import difflib
+import hashlib
+import json
+import math
+import msgspec
+import orjson
 import os
+import pybase64
+import re
+import threading
+from collections import OrderedDict
+from cdifflib import CSequenceMatcher
+from jinja2 import FileSystemBytecodeCache
+
+# Route difflib.unified_diff through the C implementation of SequenceMatcher
+difflib.SequenceMatcher = CSequenceMatcher
+
+# Parse request bodies and serialize jsonify() output with orjson
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__, static_folder='static', static_url_path='/static')
+app.json = OrjsonProvider(app)
+
+# Compress HTML/JSON responses, preferring brotli when the client accepts it
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+# Compression suffixes the ETag (":br"), so let Flask-Compress answer
+# If-None-Match against the suffixed value
+app.config['COMPRESS_EVALUATE_CONDITIONAL_REQUEST'] = True
+Compress(app)
+
+# Persist compiled templates so a restarted process skips Jinja compilation
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 # Get application version
 def get_version():
@@ -19,52 +53,181 @@ def get_version():
 def inject_version():
     return {'app_version': get_version()}
 
+# Tool pages take no per-request context, so each template is rendered once
+# and tagged with an ETag; browsers revalidate and get a 304 on reload
+_pages = {}
+
+def render_page(template):
+    page = _pages.get(template)
+    if page is None or app.debug:
+        body = render_template(template).encode('utf-8')
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        page = _pages[template] = (body, etag)
+    body, etag = page
+    response = app.response_class(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return render_page('index.html')
 
 @app.route('/base64')
 def base64_tool():
-    return render_template('base64.html')
+    return render_page('base64.html')
 
 @app.route('/json-beautify')
 def json_beautify_tool():
-    return render_template('json_beautify.html')
+    return render_page('json_beautify.html')
 
 @app.route('/json-diff')
 def json_diff_tool():
-    return render_template('json_diff.html')
+    return render_page('json_diff.html')
 
 @app.route('/tool-generator')
 def tool_generator():
-    return render_template('tool_generator.html')
+    return render_page('tool_generator.html')
 
 @app.route('/epoch-converter')
 def epoch_converter():
-    return render_template('epoch_converter.html')
+    return render_page('epoch_converter.html')
 
 @app.route('/url-encoder')
 def url_encoder():
-    return render_template('url_encoder.html')
+    return render_page('url_encoder.html')
 
 @app.route('/uuid-generator')
 def uuid_generator():
-    return render_template('uuid_generator.html')
+    return render_page('uuid_generator.html')
+
+# JSON results are memoized since the UI often re-submits the same payload.
+# Entries are keyed on input digests so the caches don't hold the documents,
+# and large results aren't stored so they aren't pinned in memory
+_CACHE_MAX_SIZE = 256 * 1024
+
+class _ResultCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        return None
+
+    def put(self, key, result):
+        if len(result) > _CACHE_MAX_SIZE:
+            return
+        with self.lock:
+            self.entries[key] = result
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+_beautify_cache = _ResultCache(maxsize=128)
+_diff_cache = _ResultCache(maxsize=128)
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+# orjson silently turns integers beyond 64 bits into floats, so input with
+# digit runs that long goes through the stdlib json module, which keeps them exact
+_LONG_DIGITS = re.compile(r'\d{19}')
+
+# The stdlib parser accepts NaN/Infinity and overflowing floats; reject them
+# like orjson does so validity doesn't depend on which parser ran
+def _reject_constant(name):
+    raise ValueError(f'Invalid JSON value: {name}')
+
+def _parse_finite_float(value):
+    number = float(value)
+    if math.isinf(number):
+        raise ValueError(f'Number out of range: {value}')
+    return number
+
+def _format_documents(texts, sort_keys=False):
+    # All documents go through the same serializer, so float and number
+    # formatting stays comparable line by line across them
+    if not any(_LONG_DIGITS.search(text) for text in texts):
+        options = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return [orjson.dumps(orjson.loads(text), option=options).decode('utf-8')
+                    for text in texts]
+        except orjson.JSONEncodeError:
+            # orjson won't serialize past 254 nesting levels; the stdlib json can
+            pass
+    return [json.dumps(json.loads(text, parse_constant=_reject_constant,
+                                  parse_float=_parse_finite_float),
+                       indent=2, ensure_ascii=False, sort_keys=sort_keys)
+            for text in texts]
+
+def _beautify(text):
+    key = _digest(text)
+    result = _beautify_cache.get(key)
+    if result is None:
+        result = _format_documents([text])[0]
+        _beautify_cache.put(key, result)
+    return result
+
+def _diff(json1, json2):
+    key = (_digest(json1), _digest(json2))
+    # Blank input still goes through the parser so it's reported as an error
+    if key[0] == key[1] and json1 and not json1.isspace():
+        return ''
+
+    result = _diff_cache.get(key)
+    if result is not None:
+        return result
+
+    # Parse and format both JSONs with one serializer
+    formatted1, formatted2 = _format_documents([json1, json2], sort_keys=True)
+
+    # Generate diff
+    diff = difflib.unified_diff(formatted1.splitlines(), formatted2.splitlines(),
+                                lineterm='', fromfile='JSON 1', tofile='JSON 2')
+    result = '\n'.join(diff)
+    _diff_cache.put(key, result)
+    return result
+
+# Request bodies for the tool endpoints, decoded and type-checked by msgspec
+class TextRequest(msgspec.Struct):
+    text: str = ''
+
+class BeautifyRequest(msgspec.Struct):
+    json: str = ''
+
+class DiffRequest(msgspec.Struct):
+    json1: str = ''
+    json2: str = ''
+
+def parse_request(request_type):
+    return msgspec.json.decode(request.get_data(), type=request_type)
+
+def _b64_encode(text):
+    return pybase64.b64encode(text.encode('utf-8'))
+
+def _b64_decode(text):
+    return pybase64.b64decode(text, validate=False).decode('utf-8')
 
 @app.route('/api/base64/encode', methods=['POST'])
 def base64_encode():
     try:
-        text = request.json.get('text', '')
-        encoded = base64.b64encode(text.encode('utf-8')).decode('utf-8')
-        return jsonify({'result': encoded})
+        text = parse_request(TextRequest).text
+        encoded = _b64_encode(text)
+        # Base64 output is plain ASCII, so it can be placed in the JSON body as-is
+        body = b'{"result":"' + encoded + b'"}'
+        return app.response_class(body, mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 @app.route('/api/base64/decode', methods=['POST'])
 def base64_decode():
     try:
-        encoded_text = request.json.get('text', '')
-        decoded = base64.b64decode(encoded_text).decode('utf-8')
+        encoded_text = parse_request(TextRequest).text
+        decoded = _b64_decode(encoded_text)
         return jsonify({'result': decoded})
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -72,28 +235,53 @@ def base64_decode():
 @app.route('/api/json/beautify', methods=['POST'])
 def json_beautify():
     try:
-        json_text = request.json.get('json', '')
-        parsed = json.loads(json_text)
-        beautified = json.dumps(parsed, indent=2, ensure_ascii=False)
-        return jsonify({'result': beautified})
+        json_text = parse_request(BeautifyRequest).json
+        return jsonify({'result': _beautify(json_text)})
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 @app.route('/api/json/diff', methods=['POST'])
 def json_diff():
     try:
-        json1 = request.json.get('json1', '')
-        json2 = request.json.get('json2', '')
-
-        # Parse and format both JSONs
-        parsed1 = json.loads(json1)
-        parsed2 = json.loads(json2)
-        formatted1 = json.dumps(parsed1, indent=2, sort_keys=True).splitlines()
-        formatted2 = json.dumps(parsed2, indent=2, sort_keys=True).splitlines()
-
-        # Generate diff
-        diff = list(difflib.unified_diff(formatted1, formatted2, lineterm='', fromfile='JSON 1', tofile='JSON 2'))
-        return jsonify({'result': '\n'.join(diff)})
+        data = parse_request(DiffRequest)
+        return jsonify({'result': _diff(data.json1, data.json2)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+# Operations available to /api/batch: each entry's args are validated against
+# the same request struct as the matching single endpoint
+_BATCH_OPS = {
+    'base64_encode': (TextRequest, lambda req: _b64_encode(req.text).decode('ascii')),
+    'base64_decode': (TextRequest, lambda req: _b64_decode(req.text)),
+    'json_beautify': (BeautifyRequest, lambda req: _beautify(req.json)),
+    'json_diff': (DiffRequest, lambda req: _diff(req.json1, req.json2)),
+}
+_BATCH_MAX_OPS = 100
+
+@app.route('/api/batch', methods=['POST'])
+def batch():
+    try:
+        ops = request.get_json()
+        if not isinstance(ops, list):
+            raise ValueError('Expected a JSON array of operations')
+        if len(ops) > _BATCH_MAX_OPS:
+            raise ValueError(f'A batch can hold at most {_BATCH_MAX_OPS} operations')
+
+        # Each operation succeeds or fails on its own, like a single API call
+        results = []
+        for op in ops:
+            try:
+                if not isinstance(op, dict):
+                    raise ValueError('Expected an object with "op" and "args"')
+                name = op.get('op')
+                if not isinstance(name, str) or name not in _BATCH_OPS:
+                    raise ValueError(f'Unknown operation: {name}')
+                request_type, handler = _BATCH_OPS[name]
+                args = msgspec.convert(op.get('args', {}), request_type)
+                results.append({'result': handler(args)})
+            except Exception as e:
+                results.append({'error': str(e)})
+        return jsonify({'results': results})
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -102,4 +290,4 @@ def api_version():
     return jsonify({'version': get_version()})
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5001)
\ No newline at end of file
@@ -7,6 +7,9 @@ PORT="5001"
 APP_URL="http://${HOST}:${PORT}"
 APP_FILE="app.py"
 
+# Resolve the pyenv 'ctools' interpreter once, falling back to the current python
+PYTHON_BIN=$(PYENV_VERSION=ctools pyenv which python 2>/dev/null) || PYTHON_BIN=$(command -v python3 || command -v python)
+
 # Colors
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -24,15 +27,15 @@ if [ ! -f "$APP_FILE" ]; then
     exit 1
 fi
 
-# Function to check if server is running
+# Function to check if server is running (plain TCP connect via bash)
 check_server() {
-    curl -s --connect-timeout 1 "$APP_URL" >/dev/null 2>&1
+    (exec 3<>"/dev/tcp/${HOST}/${PORT}") 2>/dev/null
     return $?
 }
 
-# Function to wait for server
+# Function to wait for server (polls every 0.1s, up to 15s)
 wait_for_server() {
-    local max_attempts=30
+    local max_attempts=150
     local attempt=0
     
     echo -e "${YELLOW}Waiting for server to be ready...${NC}"
@@ -41,7 +44,7 @@ wait_for_server() {
         if check_server; then
             return 0
         fi
-        sleep 0.5
+        sleep 0.1
         ((attempt++))
     done
     
@@ -53,10 +56,10 @@ if check_server; then
     echo -e "${GREEN}✓ Server already running at $APP_URL${NC}"
 else
     echo -e "${YELLOW}Starting Flask server at $APP_URL...${NC}"
-    echo -e "${BLUE}Activating pyenv environment 'ctools'...${NC}"
+    echo -e "${BLUE}Using Python: $PYTHON_BIN${NC}"
     
-    # Start server in background with pyenv activation
-    bash -c 'eval "$(pyenv init -)" && pyenv activate ctools && python app.py' > /dev/null 2>&1 &
+    # Start server in background directly with the resolved interpreter
+    "$PYTHON_BIN" "$APP_FILE" > /dev/null 2>&1 &
     SERVER_PID=$!
     
     # Wait for server to start
@@ -96,7 +99,7 @@ case "$OSTYPE" in
         ;;
     *)
         echo -e "${YELLOW}⚠ Unknown OS, trying default browser...${NC}"
-        bash -c 'eval "$(pyenv init -)" && pyenv activate ctools && python -c "import webbrowser; webbrowser.open(\"'$APP_URL'\")"'
+        "$PYTHON_BIN" -c "import webbrowser; webbrowser.open('$APP_URL')"
         ;;
 esac
 
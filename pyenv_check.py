@@ -4,47 +4,46 @@ Quick script to check pyenv Python setup
 """
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
-def main():
-    print("🐍 Python Environment Check")
-    print("=" * 30)
-    
-    # Python version and path
-    print(f"Python version: {sys.version}")
-    print(f"Python executable: {sys.executable}")
-    
-    # Check if pyenv is available
+def check_pyenv():
     try:
         result = subprocess.run(['pyenv', 'version'], capture_output=True, text=True)
         if result.returncode == 0:
-            print(f"Pyenv version: {result.stdout.strip()}")
-        else:
-            print("Pyenv not found or not working")
+            return f"Pyenv version: {result.stdout.strip()}"
+        return "Pyenv not found or not working"
     except FileNotFoundError:
-        print("Pyenv not installed")
-    
-    # Check pip
+        return "Pyenv not installed"
+
+def check_pip():
     try:
         import pip
-        print(f"Pip version: {pip.__version__}")
+        return f"Pip version: {pip.__version__}"
     except ImportError:
-        print("Pip not available")
-    
-    # Check Flask availability
+        return "Pip not available"
+
+def check_flask():
     try:
         import flask
-        print(f"Flask version: {flask.__version__}")
-    except ImportError:
-        print("Flask not installed - run: pip install -r requirements.txt")
-    
-    # Check requests availability  
-    try:
-        import requests
-        print(f"Requests version: {requests.__version__}")
+        return f"Flask version: {flask.__version__}"
     except ImportError:
-        print("Requests not installed - run: pip install -r requirements.txt")
-    
+        return "Flask not installed - run: pip install -r requirements.txt"
+
+def main():
+    print("🐍 Python Environment Check")
+    print("=" * 30)
+
+    # Python version and path
+    print(f"Python version: {sys.version}")
+    print(f"Python executable: {sys.executable}")
+
+    # Probes are independent, so run them concurrently and print in order
+    checks = [check_pyenv, check_pip, check_flask]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        for line in executor.map(lambda check: check(), checks):
+            print(line)
+
     print("\n✓ Environment check complete")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -71,6 +71,18 @@ class APIClient {
     async diffJSON(json1, json2) {
         return this.post('/api/json/diff', { json1, json2 });
     }
+
+    /**
+     * Run several operations in one request.
+     * ops: [{ op: 'base64_encode' | 'base64_decode' | 'json_beautify' | 'json_diff', args: {...} }]
+     * Each entry in the returned results is { result } or { error }.
+     * For bulk conversions, send up to ~50 ops per call rather than one request per item.
+     * The server rejects batches of more than 100 ops.
+     */
+    async batch(ops) {
+        const response = await this.post('/api/batch', ops);
+        return response.success ? { ...response, data: response.data.results } : response;
+    }
 }
 
 // Global API client instance